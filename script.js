@@ -30,38 +30,42 @@ const outputs = {
   countdown: el('countdown'),
   warnings: el('warnings'),
   flags: el('flags'),
+  flagList: el('flag-list'),
 };
 
-const presetInfo = {
+const presetInfo = Object.freeze({
   light: 'Light Warmth: low CPU threads, minimal memory, and small GPU blips.',
   medium: 'Medium Stress: multi-threaded CPU with moderate intensity and memory pressure.',
   max: 'Maximum Stress Test: saturates CPU threads, heavy memory activity, and aggressive GPU draws.',
-};
+});
 
-const presets = {
-  light: { cpu: 2, intensity: 25, memory: 256, gpu: 10, duration: 10 },
-  medium: { cpu: Math.max(2, Math.min(4, navigator.hardwareConcurrency || 4)), intensity: 55, memory: 768, gpu: 35, duration: 15 },
-  max: { cpu: Math.max(4, navigator.hardwareConcurrency || 8), intensity: 95, memory: 1536, gpu: 70, duration: 20 },
-};
+const presets = Object.freeze({
+  light: Object.freeze({ cpu: 2, intensity: 25, memory: 256, gpu: 10, duration: 10 }),
+  medium: Object.freeze({ cpu: Math.max(2, Math.min(4, navigator.hardwareConcurrency || 4)), intensity: 55, memory: 768, gpu: 35, duration: 15 }),
+  max: Object.freeze({ cpu: Math.max(4, navigator.hardwareConcurrency || 8), intensity: 95, memory: 1536, gpu: 70, duration: 20 }),
+});
 
 const state = {
   running: false,
   paused: false,
   workers: [],
-  workerStats: [],
+  workerStats: { ips: 0, busy: 0, samples: 0 },
   memoryBuffers: [],
+  memoryBytes: 0,
   memoryTouchTimer: null,
   memoryTouchRate: 0,
+  memoryTargetMb: 0,
   gpuContext: null,
   gpuLoop: null,
   gpuIntensity: 0,
   gpuFps: 0,
   lastGpuTimestamp: null,
   gpuFrameCounter: 0,
+  cpuBusy: 0,
   startTime: null,
   autoStopTimer: null,
+  healthTimer: null,
   lastHeartbeat: performance.now(),
-  chartData: [],
   flags: new Set(),
   targetWorkers: 0,
   lowThroughputCount: 0,
@@ -84,19 +88,19 @@ function setWarning(message) {
 }
 
 function renderFlags() {
-  const flagList = el('flag-list');
-  flagList.innerHTML = '';
   if (!state.flags.size) {
-    flagList.innerHTML = '<li>No issues detected.</li>';
+    outputs.flagList.innerHTML = '<li>No issues detected.</li>';
     outputs.flags.textContent = 'None';
     return;
   }
   outputs.flags.textContent = `${state.flags.size} issue${state.flags.size === 1 ? '' : 's'}`;
-  [...state.flags].forEach((flag) => {
+  const fragment = document.createDocumentFragment();
+  state.flags.forEach((flag) => {
     const li = document.createElement('li');
     li.textContent = flag;
-    flagList.appendChild(li);
+    fragment.appendChild(li);
   });
+  outputs.flagList.replaceChildren(fragment);
 }
 
 function addFlag(message) {
@@ -111,28 +115,38 @@ function clearFlags() {
   renderFlags();
 }
 
-function updateTelemetry() {
+function resetWorkerStats() {
+  state.workerStats.ips = 0;
+  state.workerStats.busy = 0;
+  state.workerStats.samples = 0;
+}
+
+function summarizeWorkerStats() {
+  const { ips, busy, samples } = state.workerStats;
+  return { ips, avgBusy: samples ? busy / samples : 0 };
+}
+
+function setText(node, text) {
+  if (node.textContent !== text) node.textContent = text;
+}
+
+function updateTelemetry({ ips, avgBusy }) {
   const now = performance.now();
   const elapsedSeconds = state.startTime ? ((now - state.startTime) / 1000).toFixed(1) : '0';
-  outputs.elapsed.textContent = `${elapsedSeconds}s`;
-  outputs.threads.textContent = state.workers.length;
+  setText(outputs.elapsed, `${elapsedSeconds}s`);
+  setText(outputs.threads, String(state.workers.length));
 
-  const ips = state.workerStats.reduce((acc, s) => acc + (s.iterationsPerSecond || 0), 0);
-  outputs.ips.textContent = ips.toFixed(0);
+  setText(outputs.ips, ips.toFixed(0));
 
-  const avgBusy = state.workerStats.length
-    ? state.workerStats.reduce((acc, s) => acc + (s.busy || 0), 0) / state.workerStats.length
-    : 0;
   const cores = navigator.hardwareConcurrency || Math.max(1, state.workers.length);
-  const effectiveBusy = Math.min(1, avgBusy * (state.workers.length / cores));
-  outputs.cpuBusy.textContent = `${(effectiveBusy * 100).toFixed(0)}%`;
+  state.cpuBusy = Math.min(1, avgBusy * (state.workers.length / cores));
+  setText(outputs.cpuBusy, `${(state.cpuBusy * 100).toFixed(0)}%`);
 
-  const memMb = state.memoryBuffers.reduce((acc, buf) => acc + buf.byteLength, 0);
-  outputs.memory.textContent = `${formatMb(memMb)} MB`;
-  outputs.memoryTouch.textContent = `${state.memoryTouchRate.toFixed(0)}x/sec`;
+  setText(outputs.memory, `${formatMb(state.memoryBytes)} MB`);
+  setText(outputs.memoryTouch, `${state.memoryTouchRate.toFixed(0)}x/sec`);
 
-  outputs.gpu.textContent = state.gpuIntensity > 0 ? `Active (${state.gpuIntensity}% effort)` : 'Idle';
-  outputs.gpuFps.textContent = `${state.gpuFps.toFixed(0)} fps`;
+  setText(outputs.gpu, state.gpuIntensity > 0 ? `Active (${state.gpuIntensity}% effort)` : 'Idle');
+  setText(outputs.gpuFps, `${state.gpuFps.toFixed(0)} fps`);
 }
 
 function attachSliderLabel(slider, label, suffix = '') {
@@ -151,22 +165,26 @@ class LoadChart {
   constructor(canvas) {
     this.canvas = canvas;
     this.ctx = canvas.getContext('2d');
-    this.points = Array(120).fill(0);
+    this.points = new Float64Array(120);
+    this.head = 0; // index of the oldest sample
   }
 
   push(value) {
-    this.points.push(value);
-    if (this.points.length > 120) this.points.shift();
+    this.points[this.head] = value;
+    this.head = (this.head + 1) % this.points.length;
     this.draw();
   }
 
   draw() {
-    const { ctx, canvas, points } = this;
+    const { ctx, canvas, points, head } = this;
     ctx.clearRect(0, 0, canvas.width, canvas.height);
     ctx.fillStyle = '#0b1221';
     ctx.fillRect(0, 0, canvas.width, canvas.height);
 
-    const maxValue = Math.max(1, ...points);
+    let maxValue = 1;
+    for (const p of points) {
+      if (p > maxValue) maxValue = p;
+    }
     ctx.strokeStyle = '#1f2937';
     ctx.lineWidth = 1;
     for (let i = 0; i < 5; i++) {
@@ -180,12 +198,14 @@ class LoadChart {
     ctx.strokeStyle = '#f97316';
     ctx.lineWidth = 2;
     ctx.beginPath();
-    points.forEach((p, idx) => {
-      const x = (idx / (points.length - 1)) * canvas.width;
+    const count = points.length;
+    for (let idx = 0; idx < count; idx++) {
+      const p = points[(head + idx) % count];
+      const x = (idx / (count - 1)) * canvas.width;
       const y = canvas.height - (p / maxValue) * canvas.height;
       if (idx === 0) ctx.moveTo(x, y);
       else ctx.lineTo(x, y);
-    });
+    }
     ctx.stroke();
 
     ctx.fillStyle = '#e5e7eb';
@@ -205,7 +225,9 @@ function createWorker() {
         const iterationsPerSecond = (iterations / Math.max(1, elapsed)) * 1000;
         const busy = Math.min(1, elapsed / 200);
         state.lastHeartbeat = performance.now();
-        state.workerStats.push({ iterationsPerSecond, busy });
+        state.workerStats.ips += iterationsPerSecond;
+        state.workerStats.busy += busy;
+        state.workerStats.samples += 1;
       }
     };
     worker.onerror = (err) => {
@@ -222,7 +244,7 @@ function createWorker() {
 
 function startWorkers(count, intensity) {
   cleanupWorkers();
-  state.workerStats = [];
+  resetWorkerStats();
   state.targetWorkers = count;
   for (let i = 0; i < count; i++) {
     const worker = createWorker();
@@ -239,12 +261,43 @@ function cleanupWorkers() {
   state.workers = [];
 }
 
+function startMemoryTouch() {
+  clearInterval(state.memoryTouchTimer);
+  if (!state.memoryBuffers.length) return;
+
+  const intervalMs = 750;
+  state.memoryTouchTimer = setInterval(() => {
+    let touches = 0;
+    state.memoryBuffers.forEach((buf, index) => {
+      const step = Math.max(1, Math.floor(buf.length / 64));
+      for (let i = 0; i < buf.length; i += step) {
+        buf[i] = (buf[i] + Math.random()) % 1;
+        touches++;
+      }
+      if (index % 4 === 0) buf.reverse();
+    });
+    state.memoryTouchRate = touches / (intervalMs / 1000);
+  }, intervalMs);
+}
+
+function memoryBudgetMb() {
+  // navigator.deviceMemory is an approximate GB figure and is not exposed by every browser.
+  return navigator.deviceMemory ? Math.floor(navigator.deviceMemory * 1024 * 0.5) : Infinity;
+}
+
 function allocateMemory(megabytes) {
-  state.memoryBuffers.forEach((buf) => buf.fill(0));
   state.memoryBuffers = [];
+  state.memoryBytes = 0;
+  state.memoryTargetMb = megabytes;
   clearInterval(state.memoryTouchTimer);
   state.memoryTouchRate = 0;
 
+  const budgetMb = memoryBudgetMb();
+  if (megabytes > budgetMb) {
+    addFlag(`Memory load capped at ${budgetMb} MB (half of reported device memory).`);
+    megabytes = budgetMb;
+  }
+
   if (megabytes <= 0) {
     outputs.memory.textContent = '0 MB';
     return;
@@ -253,8 +306,6 @@ function allocateMemory(megabytes) {
   const bytes = megabytes * 1024 * 1024;
   const chunk = 16 * 1024 * 1024;
   let allocated = 0;
-  let touches = 0;
-  const intervalMs = 750;
 
   try {
     while (allocated < bytes) {
@@ -267,23 +318,18 @@ function allocateMemory(megabytes) {
     setWarning(`Memory allocation limited: ${error.message}`);
     addFlag('Memory load reduced by browser/OS limits.');
   }
+  state.memoryBytes = allocated;
 
-  state.memoryTouchTimer = setInterval(() => {
-    touches = 0;
-    state.memoryBuffers.forEach((buf, index) => {
-      const step = Math.max(1, Math.floor(buf.length / 64));
-      for (let i = 0; i < buf.length; i += step) {
-        buf[i] = (buf[i] + Math.random()) % 1;
-        touches++;
-      }
-      if (index % 4 === 0) buf.reverse();
-    });
-    state.memoryTouchRate = touches / (intervalMs / 1000);
-  }, intervalMs);
+  startMemoryTouch();
 }
 
 function setupGPU(intensity) {
-  if (state.gpuContext?.isContextLost?.()) return;
+  if (state.gpuContext && !state.gpuContext.gl.isContextLost()) {
+    state.gpuIntensity = intensity;
+    return state.gpuContext;
+  }
+  if (state.gpuContext) state.gpuContext.canvas.remove();
+  state.gpuContext = null;
 
   const canvas = document.createElement('canvas');
   canvas.width = 256;
@@ -293,6 +339,7 @@ function setupGPU(intensity) {
 
   const gl = canvas.getContext('webgl');
   if (!gl) {
+    canvas.remove();
     setWarning('WebGL not available; GPU mode disabled.');
     return null;
   }
@@ -322,6 +369,7 @@ function setupGPU(intensity) {
   gl.linkProgram(program);
 
   if (!gl.getProgramParameter(program, gl.LINK_STATUS)) {
+    canvas.remove();
     setWarning('GPU shader compilation failed; disabling GPU load.');
     return null;
   }
@@ -343,7 +391,11 @@ function setupGPU(intensity) {
   gl.enableVertexAttribArray(positionLocation);
   gl.vertexAttribPointer(positionLocation, 2, gl.FLOAT, false, 0, 0);
 
-  state.gpuContext = { gl, program, canvas };
+  gl.viewport(0, 0, 256, 256);
+  gl.useProgram(program);
+  const timeLocation = gl.getUniformLocation(program, 'uTime');
+
+  state.gpuContext = { gl, program, canvas, timeLocation };
   state.gpuIntensity = intensity;
   return state.gpuContext;
 }
@@ -351,8 +403,6 @@ function setupGPU(intensity) {
 function stopGPU() {
   if (state.gpuLoop) cancelAnimationFrame(state.gpuLoop);
   state.gpuLoop = null;
-  if (state.gpuContext?.canvas) state.gpuContext.canvas.remove();
-  state.gpuContext = null;
   state.gpuFps = 0;
   state.lastGpuTimestamp = null;
   state.gpuFrameCounter = 0;
@@ -361,9 +411,7 @@ function stopGPU() {
 
 function gpuTick() {
   if (!state.running || state.paused || !state.gpuContext) return;
-  const { gl, program } = state.gpuContext;
-  gl.viewport(0, 0, 256, 256);
-  gl.useProgram(program);
+  const { gl, timeLocation } = state.gpuContext;
 
   const now = performance.now();
   if (state.lastGpuTimestamp) {
@@ -373,9 +421,9 @@ function gpuTick() {
   state.lastGpuTimestamp = now;
   state.gpuFrameCounter++;
 
+  if (timeLocation) gl.uniform1f(timeLocation, now);
   const draws = Math.max(1, Math.round(state.gpuIntensity / 10));
   for (let i = 0; i < draws; i++) {
-    gl.uniform1f(gl.getUniformLocation(program, 'uTime'), performance.now());
     gl.drawArrays(gl.TRIANGLES, 0, 6);
   }
 
@@ -399,7 +447,7 @@ function startAutoStop(minutes) {
   const end = performance.now() + ms;
   state.autoStopTimer = setInterval(() => {
     const remaining = Math.max(0, end - performance.now());
-    outputs.countdown.textContent = `${(remaining / 1000).toFixed(0)}s`;
+    setText(outputs.countdown, `${(remaining / 1000).toFixed(0)}s`);
     if (remaining <= 0) {
       setWarning('Auto-stop reached. Workload ended.');
       stopWorkload();
@@ -417,8 +465,7 @@ function startWorkload() {
   state.running = true;
   state.paused = false;
   state.startTime = performance.now();
-  state.workerStats = [];
-  state.chartData = [];
+  resetWorkerStats();
   state.lowThroughputCount = 0;
   clearFlags();
   setWarning('None');
@@ -448,14 +495,18 @@ function pauseWorkload() {
   state.workers.forEach((worker) => worker.postMessage({ type: 'pause' }));
   stopGPU();
   clearInterval(state.memoryTouchTimer);
+  clearInterval(state.healthTimer);
 }
 
 function resumeWorkload() {
   state.paused = false;
   setStatus('Running');
   state.workers.forEach((worker) => worker.postMessage({ type: 'resume' }));
-  allocateMemory(Number(controls.memory.value));
+  const memoryMb = Number(controls.memory.value);
+  if (memoryMb === state.memoryTargetMb) startMemoryTouch();
+  else allocateMemory(memoryMb);
   startGPU(Number(controls.gpu.value));
+  scheduleHealthCheck();
 }
 
 function stopWorkload() {
@@ -465,27 +516,24 @@ function stopWorkload() {
   stopGPU();
   clearInterval(state.memoryTouchTimer);
   clearInterval(state.autoStopTimer);
+  clearInterval(state.healthTimer);
   state.memoryTouchRate = 0;
   setStatus('Idle');
   outputs.countdown.textContent = '-';
-  outputs.gpu.textContent = 'Idle';
   el('start').disabled = false;
   el('pause').disabled = true;
   el('stop').disabled = true;
 }
 
 function scheduleHealthCheck() {
-  const watchdog = setInterval(() => {
-    if (!state.running) {
-      clearInterval(watchdog);
-      return;
-    }
+  clearInterval(state.healthTimer);
+  state.lastHeartbeat = performance.now();
+  state.healthTimer = setInterval(() => {
     const delta = performance.now() - state.lastHeartbeat;
     if (delta > 4000) {
       setWarning('Heartbeat stalled. Load stopped for safety.');
       addFlag('Not applying load correctly (workers stalled).');
       stopWorkload();
-      clearInterval(watchdog);
     }
   }, 2000);
 }
@@ -504,28 +552,26 @@ function applyPreset(key) {
 
 function updateChart() {
   if (!state.running) return;
-  const ips = state.workerStats.reduce((acc, s) => acc + (s.iterationsPerSecond || 0), 0);
-  chart.push(ips);
-  state.workerStats = [];
-  updateTelemetry();
-
-  if (state.running) {
-    if (state.workers.length < state.targetWorkers) {
-      addFlag('CPU workers below requested count — browser may cap worker creation.');
-    }
-    const busyPercent = parseInt(outputs.cpuBusy.textContent, 10) || 0;
-    if (busyPercent < 5 && !state.paused && Number(controls.cpuIntensity.value) > 20) {
-      state.lowThroughputCount += 1;
-      if (state.lowThroughputCount > 3) {
-        addFlag('Not applying load correctly (CPU throughput extremely low).');
-      }
-    } else {
-      state.lowThroughputCount = 0;
-    }
+  const summary = summarizeWorkerStats();
+  chart.push(summary.ips);
+  resetWorkerStats();
+  updateTelemetry(summary);
 
-    if (Number(controls.gpu.value) > 0 && !state.gpuContext) {
-      addFlag('GPU load disabled (missing WebGL support).');
+  if (state.workers.length < state.targetWorkers) {
+    addFlag('CPU workers below requested count — browser may cap worker creation.');
+  }
+  const busyPercent = Math.round(state.cpuBusy * 100);
+  if (busyPercent < 5 && !state.paused && Number(controls.cpuIntensity.value) > 20) {
+    state.lowThroughputCount += 1;
+    if (state.lowThroughputCount > 3) {
+      addFlag('Not applying load correctly (CPU throughput extremely low).');
     }
+  } else {
+    state.lowThroughputCount = 0;
+  }
+
+  if (Number(controls.gpu.value) > 0 && !state.gpuContext) {
+    addFlag('GPU load disabled (missing WebGL support).');
   }
 }
 
@@ -1,6 +1,13 @@
 let running = false;
 let paused = false;
 let intensity = 0.5;
+let targetIterations = iterationsFor(intensity);
+const statsMessage = { type: 'stats', iterations: 0, elapsed: 0 };
+
+function iterationsFor(level) {
+  const computeWindow = 150 * level; // ms of busy time per cycle proportional to intensity
+  return Math.max(1, Math.floor(computeWindow * 500));
+}
 
 function busyMath(iterationsTarget) {
   let iterations = 0;
@@ -19,12 +26,12 @@ function cycle() {
   if (!running || paused) return;
 
   const cycleStart = performance.now();
-  const computeWindow = 150 * intensity; // ms of busy time per cycle proportional to intensity
-  const targetIterations = Math.max(1, Math.floor(computeWindow * 500));
   const iterations = busyMath(targetIterations);
   const elapsed = performance.now() - cycleStart;
 
-  self.postMessage({ type: 'stats', iterations, elapsed });
+  statsMessage.iterations = iterations;
+  statsMessage.elapsed = elapsed;
+  self.postMessage(statsMessage);
 
   const cycleDuration = 200;
   const delay = Math.max(0, cycleDuration - elapsed);
@@ -35,11 +42,13 @@ self.onmessage = (event) => {
   const { type, payload } = event.data;
   if (type === 'start') {
     intensity = payload.intensity;
+    targetIterations = iterationsFor(intensity);
     running = true;
     paused = false;
     cycle();
   } else if (type === 'update') {
     intensity = payload.intensity;
+    targetIterations = iterationsFor(intensity);
   } else if (type === 'pause') {
     paused = true;
   } else if (type === 'resume') {